@@ -1,6 +1,7 @@
 """Main argument parser for OpenHands CLI."""
 
 import argparse
+import sys
 
 from openhands_cli import __version__
 from openhands_cli.argparsers.acp_parser import add_acp_parser
@@ -133,3 +134,79 @@ def create_main_parser() -> argparse.ArgumentParser:
     add_view_parser(subparsers)
 
     return parser
+
+
+# Top-level boolean flags understood by the parse_main_args fast path, mapped
+# to the Namespace attribute argparse would set for them.
+_FAST_PATH_FLAGS = {
+    "--always-approve": "always_approve",
+    "--yolo": "always_approve",
+    "--llm-approve": "llm_approve",
+    "--last": "last",
+    "--exit-without-confirmation": "exit_without_confirmation",
+    "--override-with-envs": "override_with_envs",
+}
+
+
+def _parse_common_args(argv: list[str]) -> argparse.Namespace | None:
+    """Parse common top-level invocations without building the full parser.
+
+    Only handles the flags in _FAST_PATH_FLAGS plus ``--resume [ID]``.
+    Returns None for anything else (subcommands, --help, --task, unknown or
+    abbreviated flags, conflicting confirmation modes) so that argparse can
+    parse it or report the error.
+    """
+    values: dict[str, str | bool | None] = {
+        "task": None,
+        "file": None,
+        "resume": None,
+        "last": False,
+        "headless": False,
+        "json": False,
+        "always_approve": False,
+        "llm_approve": False,
+        "exit_without_confirmation": False,
+        "override_with_envs": False,
+        "command": None,
+    }
+
+    i = 0
+    while i < len(argv):
+        token = argv[i]
+        if token in _FAST_PATH_FLAGS:
+            values[_FAST_PATH_FLAGS[token]] = True
+        elif token == "--resume":
+            # Mirrors nargs="?", const="": take the next token as the ID
+            # unless it looks like an option.
+            next_token = argv[i + 1] if i + 1 < len(argv) else None
+            if next_token is not None and not next_token.startswith("-"):
+                values["resume"] = next_token
+                i += 1
+            else:
+                values["resume"] = ""
+        else:
+            return None
+        i += 1
+
+    if values["always_approve"] and values["llm_approve"]:
+        return None
+
+    return argparse.Namespace(**values)
+
+
+def parse_main_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse CLI arguments, skipping parser construction for common cases.
+
+    Args:
+        argv: Arguments to parse. Defaults to ``sys.argv[1:]``.
+
+    Returns:
+        The parsed arguments, identical to ``create_main_parser().parse_args()``
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    args = _parse_common_args(argv)
+    if args is None:
+        args = create_main_parser().parse_args(argv)
+    return args
@@ -13,7 +13,10 @@ from pathlib import Path
 from dotenv import load_dotenv
 from rich.console import Console
 
-from openhands_cli.argparsers.main_parser import create_main_parser
+from openhands_cli.argparsers.main_parser import (
+    create_main_parser,
+    parse_main_args,
+)
 from openhands_cli.stores import (
     MissingEnvironmentVariablesError,
     check_and_warn_env_vars,
@@ -93,15 +96,16 @@ def main() -> None:
         ImportError: If agent chat dependencies are missing
         Exception: On other error conditions
     """
-    parser = create_main_parser()
-    args = parser.parse_args()
+    args = parse_main_args()
 
     # Handle --json flag (only works with --headless)
     json_mode = args.json and args.headless
 
     # Validate headless mode requirements
     if args.headless and not args.task and not args.file:
-        parser.error("--headless requires either --task or --file to be specified")
+        create_main_parser().error(
+            "--headless requires either --task or --file to be specified"
+        )
 
     # Automatically set exit_without_confirmation when headless mode is used
     if args.headless:
@@ -176,7 +180,7 @@ def main() -> None:
         elif args.command == "cloud":
             # Validate cloud mode requirements
             if not args.task and not args.file:
-                parser.error(
+                create_main_parser().error(
                     "cloud subcommand requires either --task or --file to be specified"
                 )
 
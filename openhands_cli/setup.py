@@ -73,12 +73,11 @@ def load_agent_specs(
 
     if skills:
         if agent.agent_context is not None:
-            existing_skills = agent.agent_context.skills
-            existing_skills.extend(skills)
+            # Build a new list so the loaded context's skills are never mutated
             agent = agent.model_copy(
                 update={
                     "agent_context": agent.agent_context.model_copy(
-                        update={"skills": existing_skills}
+                        update={"skills": [*agent.agent_context.skills, *skills]}
                     )
                 }
             )
@@ -4,10 +4,11 @@ from __future__ import annotations
 import json
 import os
 import re
+from functools import lru_cache
 from typing import Any
 
 from prompt_toolkit import HTML, print_formatted_text
-from pydantic import BaseModel, SecretStr
+from pydantic import BaseModel, ConfigDict, SecretStr
 from rich.console import Console
 
 from openhands.sdk import (
@@ -77,6 +78,12 @@ def get_persisted_conversation_tools(conversation_id: str) -> list[Tool] | None:
         return None
 
 
+_SYSTEM_SUFFIX_TEMPLATE = (
+    "Your current working directory is: {work_dir}\n"
+    "User operating system: {os_description}"
+)
+
+
 def get_default_critic(llm: LLM, *, enable_critic: bool = True) -> CriticBase | None:
     """Auto-configure critic for All-Hands LLM proxy.
 
@@ -125,6 +132,7 @@ DEFAULT_LLM_BASE_URL = "https://llm-proxy.app.all-hands.dev/"
 ENV_LLM_API_KEY = "LLM_API_KEY"
 ENV_LLM_BASE_URL = "LLM_BASE_URL"
 ENV_LLM_MODEL = "LLM_MODEL"
+_LLM_ENV_VARS = (ENV_LLM_API_KEY, ENV_LLM_BASE_URL, ENV_LLM_MODEL)
 
 
 class MissingEnvironmentVariablesError(Exception):
@@ -151,13 +159,7 @@ def check_and_warn_env_vars() -> None:
     This function should be called when env overrides are disabled to inform
     users that their environment variables are being ignored.
     """
-    env_vars_set = []
-    if os.environ.get(ENV_LLM_API_KEY):
-        env_vars_set.append(ENV_LLM_API_KEY)
-    if os.environ.get(ENV_LLM_BASE_URL):
-        env_vars_set.append(ENV_LLM_BASE_URL)
-    if os.environ.get(ENV_LLM_MODEL):
-        env_vars_set.append(ENV_LLM_MODEL)
+    env_vars_set = [name for name in _LLM_ENV_VARS if os.environ.get(name)]
 
     if env_vars_set:
         console = Console(stderr=True)
@@ -179,8 +181,12 @@ class LLMEnvOverrides(BaseModel):
 
     Use the `from_env()` class method to load values from environment
     variables when env overrides are enabled.
+
+    Instances are frozen because loads with the same environment share one.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     api_key: SecretStr | None = None
     base_url: str | None = None
     model: str | None = None
@@ -198,23 +204,13 @@ class LLMEnvOverrides(BaseModel):
             or empty overrides (if disabled).
         """
         if not enabled:
-            return cls()
-
-        result: dict[str, Any] = {}
-
-        api_key_str = os.environ.get(ENV_LLM_API_KEY) or None
-        if api_key_str:
-            result["api_key"] = SecretStr(api_key_str)
-
-        base_url = os.environ.get(ENV_LLM_BASE_URL) or None
-        if base_url:
-            result["base_url"] = base_url
+            return _NO_OVERRIDES
 
-        model = os.environ.get(ENV_LLM_MODEL) or None
-        if model:
-            result["model"] = model
-
-        return cls(**result)
+        return _build_overrides(
+            os.environ.get(ENV_LLM_API_KEY) or None,
+            os.environ.get(ENV_LLM_BASE_URL) or None,
+            os.environ.get(ENV_LLM_MODEL) or None,
+        )
 
     def require_for_headless(self) -> None:
         missing: list[str] = []
@@ -227,7 +223,53 @@ class LLMEnvOverrides(BaseModel):
 
     def has_overrides(self) -> bool:
         """Check if any overrides are set."""
-        return any([self.api_key, self.base_url, self.model])
+        return self.api_key is not None or bool(self.base_url) or bool(self.model)
+
+
+# Shared empty overrides returned while env overrides are disabled (the default).
+# Built with model_construct since there is nothing to validate.
+_NO_OVERRIDES = LLMEnvOverrides.model_construct()
+
+
+@lru_cache(maxsize=4)
+def _build_overrides(
+    api_key: str | None, base_url: str | None, model: str | None
+) -> LLMEnvOverrides:
+    """Build LLMEnvOverrides for a snapshot of the LLM environment variables.
+
+    Keyed on the raw env values, so a changed environment yields a fresh
+    instance while repeated loads with the same environment share one.
+    """
+    result: dict[str, Any] = {}
+    if api_key:
+        # The SecretStr field coerces the raw string during validation
+        result["api_key"] = api_key
+    if base_url:
+        result["base_url"] = base_url
+    if model:
+        result["model"] = model
+    return LLMEnvOverrides(**result)
+
+
+def _override_update(overrides: LLMEnvOverrides) -> dict[str, Any]:
+    """Collect the set override fields as a model_copy update dict.
+
+    Returns an empty dict when no overrides are set. Equivalent to
+    ``overrides.model_dump(exclude_none=True)`` without walking the model
+    schema for three known fields.
+    """
+    if overrides is _NO_OVERRIDES or not overrides.has_overrides():
+        return {}
+
+    return {
+        key: value
+        for key, value in (
+            ("api_key", overrides.api_key),
+            ("base_url", overrides.base_url),
+            ("model", overrides.model),
+        )
+        if value is not None
+    }
 
 
 def apply_llm_overrides(llm: LLM, overrides: LLMEnvOverrides) -> LLM:
@@ -240,10 +282,8 @@ def apply_llm_overrides(llm: LLM, overrides: LLMEnvOverrides) -> LLM:
     Returns:
         Updated LLM instance with overrides applied
     """
-    if not overrides.has_overrides():
-        return llm
-
-    return llm.model_copy(update=overrides.model_dump(exclude_none=True))
+    update = _override_update(overrides)
+    return llm.model_copy(update=update) if update else llm
 
 
 class AgentStore:
@@ -291,19 +331,6 @@ class AgentStore:
         )
         return get_default_cli_agent(llm)
 
-    def _apply_env_overrides(self, agent: Agent, overrides: LLMEnvOverrides) -> Agent:
-        if not overrides.has_overrides():
-            return agent
-
-        updated_llm = apply_llm_overrides(agent.llm, overrides)
-
-        condenser = None
-        if agent.condenser and isinstance(agent.condenser, LLMSummarizingCondenser):
-            condenser = agent.condenser
-            updated_condenser_llm = apply_llm_overrides(condenser.llm, overrides)
-            condenser = condenser.model_copy(update={"llm": updated_condenser_llm})
-        return agent.model_copy(update={"llm": updated_llm, "condenser": condenser})
-
     def load_or_create(
         self,
         session_id: str | None = None,
@@ -345,15 +372,16 @@ class AgentStore:
 
         if env_overrides_enabled:
             agent = self._ensure_agent(agent, overrides)
-            agent = self._apply_env_overrides(agent, overrides)
 
         if agent is None:
             return None
 
-        # Apply runtime configuration (tools, context, MCP, condenser, critic)
+        # Apply env overrides and runtime configuration (tools, context, MCP,
+        # condenser, critic) in a single pass over the agent.
         return self._apply_runtime_config(
             agent,
             session_id,
+            overrides=overrides,
             critic_disabled=critic_disabled,
         )
 
@@ -361,48 +389,68 @@ class AgentStore:
         tools = get_persisted_conversation_tools(session_id) if session_id else None
         return tools or get_default_cli_tools()
 
-    def _with_llm_metadata(
-        self, llm: LLM, *, session_id: str | None, llm_type: str
+    def _refresh_llm(
+        self,
+        llm: LLM,
+        override_update: dict[str, Any],
+        *,
+        session_id: str | None,
+        llm_type: str,
     ) -> LLM:
-        if not should_set_litellm_extra_body(llm.model, llm.base_url):
-            return llm
+        """Apply env overrides and LLM metadata with a single model_copy.
+
+        ``override_update`` is shared between the agent and condenser LLMs,
+        so it is never mutated here.
+        """
+        model = override_update.get("model", llm.model)
+        base_url = override_update.get("base_url", llm.base_url)
+        if not should_set_litellm_extra_body(model, base_url):
+            return llm.model_copy(update=override_update) if override_update else llm
+
         return llm.model_copy(
             update={
+                **override_update,
                 "litellm_extra_body": {
                     "metadata": get_llm_metadata(
-                        model_name=llm.model,
+                        model_name=model,
                         llm_type=llm_type,
                         session_id=session_id,
                     )
-                }
+                },
             }
         )
 
     def _build_agent_context(self) -> AgentContext:
-        skills = load_project_skills(get_work_dir())
-        system_suffix = "\n".join(
-            [
-                f"Your current working directory is: {get_work_dir()}",
-                f"User operating system: {get_os_description()}",
-            ]
+        # Read project skills on every load so /new picks up edits to skill
+        # files or AGENTS.md made during the session.
+        work_dir = get_work_dir()
+        system_suffix = _SYSTEM_SUFFIX_TEMPLATE.format(
+            work_dir=work_dir, os_description=get_os_description()
         )
         return AgentContext(
-            skills=skills,
+            skills=load_project_skills(work_dir),
             system_message_suffix=system_suffix,
             load_user_skills=True,
             load_public_skills=True,
         )
 
     def _maybe_build_condenser(
-        self, agent: Agent, *, session_id: str | None
+        self,
+        agent: Agent,
+        override_update: dict[str, Any],
+        *,
+        session_id: str | None,
     ) -> LLMSummarizingCondenser | None:
         if not (
             agent.condenser and isinstance(agent.condenser, LLMSummarizingCondenser)
         ):
             return None
 
-        condenser_llm = self._with_llm_metadata(
-            agent.condenser.llm, session_id=session_id, llm_type="condenser"
+        condenser_llm = self._refresh_llm(
+            agent.condenser.llm,
+            override_update,
+            session_id=session_id,
+            llm_type="condenser",
         )
 
         return agent.condenser.model_copy(update={"llm": condenser_llm})
@@ -412,11 +460,14 @@ class AgentStore:
         agent: Agent,
         session_id: str | None = None,
         *,
+        overrides: LLMEnvOverrides = _NO_OVERRIDES,
         critic_disabled: bool = False,
     ) -> Agent:
         updated_tools = self._resolve_tools(session_id)
-        updated_llm = self._with_llm_metadata(
-            agent.llm, session_id=session_id, llm_type="agent"
+        # Build the override update once for both the agent and condenser LLMs
+        override_update = _override_update(overrides)
+        updated_llm = self._refresh_llm(
+            agent.llm, override_update, session_id=session_id, llm_type="agent"
         )
 
         agent_context = self._build_agent_context()
@@ -424,7 +475,9 @@ class AgentStore:
         enabled_servers = list_enabled_servers()
         mcp_config = {"mcpServers": enabled_servers} if enabled_servers else {}
 
-        condenser = self._maybe_build_condenser(agent, session_id=session_id)
+        condenser = self._maybe_build_condenser(
+            agent, override_update, session_id=session_id
+        )
 
         critic = None
         if not critic_disabled:
@@ -481,7 +534,9 @@ class AgentStore:
             usage_id="condenser",
         )
 
-        condenser = LLMSummarizingCondenser(llm=condenser_llm)
+        # condenser_llm is an already-validated LLM and the remaining fields
+        # are defaults, so skip re-validation.
+        condenser = LLMSummarizingCondenser.model_construct(llm=condenser_llm)
 
         agent = Agent(
             llm=llm,
@@ -7,6 +7,11 @@ from pathlib import Path
 from pydantic import BaseModel
 
 
+# Parsed settings keyed by config path, tagged with the file's (mtime, size)
+# so an unchanged file is not re-read every time settings are loaded.
+_load_cache: dict[Path, tuple[tuple[int, int], "CliSettings"]] = {}
+
+
 class CliSettings(BaseModel):
     """Model for CLI-level settings."""
 
@@ -33,20 +38,33 @@ class CliSettings(BaseModel):
         """
         config_path = cls.get_config_path()
 
-        if not config_path.exists():
+        # Treat a missing path the way Path.exists() does, including a
+        # PERSISTENCE_DIR that points at a regular file.
+        try:
+            stat = config_path.stat()
+        except (FileNotFoundError, NotADirectoryError):
             return cls()
 
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = _load_cache.get(config_path)
+        if cached is not None and cached[0] == file_key:
+            return cached[1].model_copy()
+
         try:
             with open(config_path) as f:
                 data = json.load(f)
-            return cls.model_validate(data)
+            settings = cls.model_validate(data)
         except (json.JSONDecodeError, ValueError):
             # If file is corrupted, return defaults
-            return cls()
+            settings = cls()
+
+        _load_cache[config_path] = (file_key, settings)
+        return settings.model_copy()
 
     def save(self) -> None:
         """Save CLI settings to file."""
         config_path = self.get_config_path()
+        _load_cache.pop(config_path, None)
 
         # Ensure the persistence directory exists
         config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -27,7 +27,7 @@ class SettingsSwitch(Container):
             value: Initial value of the switch
         """
         super().__init__(classes="form_group", **kwargs)
-        self._label = label
+        self._label_text = f"{label}:"
         self._description = description
         self._switch_id = switch_id
         self._value = value
@@ -35,7 +35,7 @@ class SettingsSwitch(Container):
     def compose(self) -> ComposeResult:
         """Compose the switch with label and description."""
         with Horizontal(classes="switch_container"):
-            yield Label(f"{self._label}:", classes="form_label switch_label")
+            yield Label(self._label_text, classes="form_label switch_label")
             yield Switch(value=self._value, id=self._switch_id, classes="form_switch")
         yield Static(self._description, classes="form_help switch_help")
 
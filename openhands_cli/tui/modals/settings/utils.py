@@ -4,6 +4,7 @@ from pydantic import BaseModel, SecretStr, field_validator
 
 from openhands.sdk import LLM, Agent, LLMSummarizingCondenser
 from openhands_cli.stores import AgentStore
+from openhands_cli.stores.agent_store import DEFAULT_LLM_BASE_URL
 from openhands_cli.utils import (
     get_default_cli_agent,
     get_llm_metadata,
@@ -102,8 +103,8 @@ def save_settings(
 
         full_model = data.get_full_model_name()
 
-        if full_model.startswith("openhands/") and data.base_url is None:
-            data.base_url = "https://llm-proxy.app.all-hands.dev/"
+        if full_model.startswith("openhands/"):
+            data.base_url = data.base_url or DEFAULT_LLM_BASE_URL
 
         if should_set_litellm_extra_body(full_model, data.base_url):
             extra_kwargs["litellm_extra_body"] = {
@@ -13,6 +13,13 @@ from openhands.sdk.critic.result import CriticResult
 from openhands_cli.tui.widgets.collapsible import Collapsible
 
 
+# A (text, style) pair accepted by Text.assemble
+_Span = tuple[str, str]
+
+# Shared content for critic results with nothing to show (treat as read-only)
+_EMPTY_TEXT = Text()
+
+
 def create_critic_collapsible(critic_result: CriticResult) -> Collapsible:
     """Create a collapsible widget for critic score visualization.
 
@@ -30,7 +37,7 @@ def create_critic_collapsible(critic_result: CriticResult) -> Collapsible:
     content_text = _build_critic_content(critic_result)
 
     # Check if there's any content to display
-    has_content = len(content_text.plain.strip()) > 0
+    has_content = content_text is not _EMPTY_TEXT
 
     # Create collapsible - only expand if there's content to show
     collapsible = Collapsible(
@@ -45,11 +52,13 @@ def create_critic_collapsible(critic_result: CriticResult) -> Collapsible:
     return collapsible
 
 
+# Star strings indexed by the number of filled stars (0-5)
+_STAR_TABLE = tuple("★" * filled + "☆" * (5 - filled) for filled in range(6))
+
+
 def _get_star_rating(score: float) -> str:
     """Convert score (0-1) to a 5-star rating string."""
-    filled_stars = round(score * 5)
-    empty_stars = 5 - filled_stars
-    return "★" * filled_stars + "☆" * empty_stars
+    return _STAR_TABLE[min(max(round(score * 5), 0), 5)]
 
 
 def _get_star_style(score: float) -> str:
@@ -96,67 +105,68 @@ def _build_critic_content(critic_result: CriticResult) -> Text:
         critic_result: The critic result to visualize
 
     Returns:
-        Rich Text object with formatted critic breakdown
+        Rich Text object with formatted critic breakdown, or the shared
+        ``_EMPTY_TEXT`` when there is nothing to display
     """
-    content_text = Text()
-
     # Use pre-categorized features from metadata if available
     if critic_result.metadata:
         categorized = critic_result.metadata.get("categorized_features")
         if categorized:
-            _append_categorized_features_for_cli(content_text, categorized)
-            return content_text
+            spans = _categorized_feature_spans_for_cli(categorized)
+            return Text.assemble(*spans) if spans else _EMPTY_TEXT
 
     # Fallback: display message as-is if no categorized features
-    if critic_result.message:
-        content_text.append(f"\n{critic_result.message}\n")
+    if critic_result.message and not critic_result.message.isspace():
+        return Text(f"\n{critic_result.message}\n")
 
-    return content_text
+    return _EMPTY_TEXT
 
 
-def _append_categorized_features_for_cli(
-    content_text: Text, categorized: dict[str, Any]
-) -> None:
-    """Append features from pre-categorized metadata (CLI-filtered).
+def _categorized_feature_spans_for_cli(
+    categorized: dict[str, Any],
+) -> list[_Span]:
+    """Collect spans for pre-categorized metadata (CLI-filtered).
 
     Only shows Potential Issues and Infrastructure.
     Filters out Likely Follow-up and Other sections for CLI.
 
     Args:
-        content_text: Rich Text object to append to
         categorized: Pre-categorized features from SDK metadata
+
+    Returns:
+        List of (text, style) spans to pass to Text.assemble
     """
-    has_content = False
+    spans: list[_Span] = []
 
     # Agent behavioral issues (Potential Issues)
     agent_issues = categorized.get("agent_behavioral_issues", [])
     if agent_issues:
-        content_text.append("Potential Issues: ", style="bold")
-        _append_feature_list_inline(content_text, agent_issues)
-        has_content = True
+        spans.append(("Potential Issues: ", "bold"))
+        spans.extend(_feature_list_spans(agent_issues))
 
     # Infrastructure issues
     infra_issues = categorized.get("infrastructure_issues", [])
     if infra_issues:
-        if has_content:
-            content_text.append("\n")
-        content_text.append("Infrastructure: ", style="bold")
-        _append_feature_list_inline(content_text, infra_issues)
+        if spans:
+            spans.append(("\n", ""))
+        spans.append(("Infrastructure: ", "bold"))
+        spans.extend(_feature_list_spans(infra_issues))
 
     # NOTE: Likely Follow-up and Other sections are intentionally
     # NOT displayed in CLI as they are less actionable for users
+    return spans
 
 
-def _append_feature_list_inline(
-    content_text: Text,
-    features: list[dict[str, Any]],
-) -> None:
-    """Append features inline with likelihood percentages.
+def _feature_list_spans(features: list[dict[str, Any]]) -> list[_Span]:
+    """Collect inline feature spans with likelihood percentages.
 
     Args:
-        content_text: Rich Text object to append to
         features: List of feature dicts with 'display_name' and 'probability'
+
+    Returns:
+        List of (text, style) spans to pass to Text.assemble
     """
+    spans: list[_Span] = []
     for i, feature in enumerate(features):
         display_name = feature.get("display_name", feature.get("name", "Unknown"))
         prob = feature.get("probability", 0.0)
@@ -172,7 +182,8 @@ def _append_feature_list_inline(
 
         # Add dot separator between features
         if i > 0:
-            content_text.append(" · ", style="dim")
+            spans.append((" · ", "dim"))
 
-        content_text.append(f"{display_name}", style="white")
-        content_text.append(f" (likelihood {percentage:.0f}%)", style=prob_style)
+        spans.append((f"{display_name}", "white"))
+        spans.append((f" (likelihood {percentage:.0f}%)", prob_style))
+    return spans
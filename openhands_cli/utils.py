@@ -5,6 +5,7 @@ import os
 import platform
 import re
 from argparse import Namespace
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -53,6 +54,7 @@ def format_cost(cost: float) -> str:
     return f"{cost:.4f}"
 
 
+@cache
 def get_os_description() -> str:
     system = platform.system() or "Unknown"
 
@@ -78,6 +80,7 @@ def get_os_description() -> str:
 _LLM_PROXY_PATTERN = re.compile(r"^https?://llm-proxy\.[^.]+\.all-hands\.dev(?:/|$)")
 
 
+@lru_cache(maxsize=32)
 def should_set_litellm_extra_body(model_name: str, base_url: str | None = None) -> bool:
     """
     Determine if litellm_extra_body should be set based on the model name or base URL.
@@ -160,14 +163,19 @@ def get_llm_metadata(
     return metadata
 
 
-def get_default_cli_tools() -> list[Tool]:
-    """Get the default tool specifications for CLI mode (browser disabled)."""
-    return [
+@cache
+def _default_cli_tools() -> tuple[Tool, ...]:
+    return (
         Tool(name=TerminalTool.name),
         Tool(name=FileEditorTool.name),
         Tool(name=TaskTrackerTool.name),
         Tool(name=DelegateTool.name),
-    ]
+    )
+
+
+def get_default_cli_tools() -> list[Tool]:
+    """Get the default tool specifications for CLI mode (browser disabled)."""
+    return list(_default_cli_tools())
 
 
 def get_default_cli_agent(llm: LLM) -> Agent:
@@ -0,0 +1,36 @@
+"""Shared fixtures for ACP tests."""
+
+import asyncio
+import itertools
+import os
+import uuid
+from typing import Any
+
+import pytest
+
+
+_session_counter = itertools.count(1)
+
+
+def resolved_future(value: Any) -> asyncio.Future:
+    """Return an already-resolved future, awaitable without a coroutine."""
+    future = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """Skip cloud-marked tests when OPENHANDS_SKIP_CLOUD_TESTS=1."""
+    if os.environ.get("OPENHANDS_SKIP_CLOUD_TESTS") != "1":
+        return
+
+    skip_cloud = pytest.mark.skip(reason="OPENHANDS_SKIP_CLOUD_TESTS=1")
+    for item in items:
+        if "cloud" in item.keywords:
+            item.add_marker(skip_cloud)
+
+
+@pytest.fixture
+def session_id() -> str:
+    """Return a unique, deterministic session ID for the test."""
+    return str(uuid.UUID(int=next(_session_counter)))
@@ -5,26 +5,49 @@ for shared functionality. More detailed unit tests for the BaseOpenHandsACPAgent
 methods are in test_base_agent.py.
 """
 
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
 
 import pytest
 from acp import RequestError
 
+from openhands.sdk import Message, TextContent
+from openhands.sdk.event.llm_convertible.message import MessageEvent
+from openhands.sdk.security.confirmation_policy import AlwaysConfirm, NeverConfirm
 from openhands_cli.acp_impl.agent import LocalOpenHandsACPAgent, OpenHandsCloudACPAgent
 
 
-@pytest.fixture
+EXPECTED_MODE_IDS = ["always-ask", "always-approve", "llm-approve"]
+
+
+@pytest.fixture(scope="module")
 def mock_connection():
-    """Create a mock ACP connection."""
+    """Create a mock ACP connection shared across the module."""
     return AsyncMock()
 
 
-@pytest.fixture(params=["local", "cloud"])
-def agent(request, mock_connection):
-    """Parameterized fixture that creates either local or cloud agent."""
+@pytest.fixture(autouse=True)
+def _reset_mock_connection(mock_connection):
+    """Clear call history on the shared connection before each test."""
+    mock_connection.reset_mock()
+
+
+@pytest.fixture
+def local_agent(mock_connection):
+    """Local agent for input validation that runs before any cloud-specific code."""
+    return LocalOpenHandsACPAgent(mock_connection, "always-ask")
+
+
+@pytest.fixture(params=("local", pytest.param("cloud", marks=pytest.mark.cloud)))
+def agent_setup(request, mock_connection):
+    """Parameterized fixture returning ``(agent, setup_session)``.
+
+    ``setup_session(session_id, conversation)`` registers the conversation as
+    active on the agent, adding the workspace stub the cloud agent expects.
+    """
     if request.param == "local":
-        return LocalOpenHandsACPAgent(mock_connection, "always-ask")
+        agent = LocalOpenHandsACPAgent(mock_connection, "always-ask")
     else:
         with patch(
             "openhands_cli.acp_impl.agent.base_agent.TokenStorage"
@@ -32,12 +55,19 @@ def agent(request, mock_connection):
             mock_storage = MagicMock()
             mock_storage.get_api_key.return_value = "test-api-key"
             mock_storage_class.return_value = mock_storage
-            return OpenHandsCloudACPAgent(
+            agent = OpenHandsCloudACPAgent(
                 conn=mock_connection,
                 initial_confirmation_mode="always-ask",
                 cloud_api_url="https://app.all-hands.dev",
             )
 
+    def setup_session(session_id: str, conversation: Any) -> None:
+        agent._active_sessions[session_id] = conversation
+        if isinstance(agent, OpenHandsCloudACPAgent):
+            agent._active_workspaces[session_id] = MagicMock()
+
+    return agent, setup_session
+
 
 class TestLoadSession:
     """Tests for load_session - both agents handle session loading consistently."""
@@ -45,12 +75,14 @@ class TestLoadSession:
     @pytest.mark.asyncio
     @pytest.mark.parametrize(
         "invalid_session_id",
-        ["not-a-uuid", "12345", "invalid-session"],
+        ("not-a-uuid", "12345", "invalid-session"),
     )
-    async def test_load_session_rejects_invalid_uuid(self, agent, invalid_session_id):
+    async def test_load_session_rejects_invalid_uuid(
+        self, local_agent, invalid_session_id
+    ):
         """Test load_session rejects invalid UUIDs."""
         with pytest.raises(RequestError) as exc_info:
-            await agent.load_session(
+            await local_agent.load_session(
                 cwd="/tmp", mcp_servers=[], session_id=invalid_session_id
             )
 
@@ -58,13 +90,11 @@ class TestLoadSession:
         assert "Invalid session ID" in exc_info.value.data.get("reason", "")
 
     @pytest.mark.asyncio
-    async def test_load_session_replays_historic_events(self, agent, mock_connection):
+    async def test_load_session_replays_historic_events(
+        self, agent_setup, mock_connection, session_id
+    ):
         """Test that load_session replays historic events to the client."""
-        from openhands.sdk import Message, TextContent
-        from openhands.sdk.event.llm_convertible.message import MessageEvent
-
-        session_id = str(uuid4())
-
+        agent, setup_session = agent_setup
         mock_event1 = MessageEvent(
             source="user",
             llm_message=Message(role="user", content=[TextContent(text="Hello")]),
@@ -76,12 +106,13 @@ class TestLoadSession:
             ),
         )
 
-        mock_conversation = MagicMock()
-        mock_conversation.state.events = [mock_event1, mock_event2]
-        agent._active_sessions[session_id] = mock_conversation
-
-        if isinstance(agent, OpenHandsCloudACPAgent):
-            agent._active_workspaces[session_id] = MagicMock()
+        mock_conversation = SimpleNamespace(
+            state=SimpleNamespace(
+                events=[mock_event1, mock_event2],
+                confirmation_policy=AlwaysConfirm(),
+            )
+        )
+        setup_session(session_id, mock_conversation)
 
         # EventSubscriber is imported in base_agent for local agent's load_session
         # and in remote_agent for cloud agent's load_session override
@@ -105,62 +136,50 @@ class TestLoadSession:
             assert mock_subscriber.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_load_session_includes_modes(self, agent):
+    async def test_load_session_includes_modes(self, agent_setup, session_id):
         """Test that load_session returns modes in response."""
-        session_id = str(uuid4())
-
+        agent, setup_session = agent_setup
         mock_conversation = MagicMock()
         mock_conversation.state.events = []
-        agent._active_sessions[session_id] = mock_conversation
-
-        if isinstance(agent, OpenHandsCloudACPAgent):
-            agent._active_workspaces[session_id] = MagicMock()
+        setup_session(session_id, mock_conversation)
 
         response = await agent.load_session(
             cwd="/tmp", mcp_servers=[], session_id=session_id
         )
 
         assert response is not None
-        assert response.modes is not None
-        assert response.modes.current_mode_id == "always-ask"
-        assert len(response.modes.available_modes) == 3
-        mode_ids = {mode.id for mode in response.modes.available_modes}
-        assert mode_ids == {"always-ask", "always-approve", "llm-approve"}
+        modes = response.modes
+        assert modes is not None
+        assert modes.current_mode_id == "always-ask"
+        assert [mode.id for mode in modes.available_modes] == EXPECTED_MODE_IDS
 
 
 class TestSetSessionMode:
     """Tests for set_session_mode - both agents handle mode changes consistently."""
 
     @pytest.mark.asyncio
-    async def test_set_session_mode_invalid(self, agent):
+    async def test_set_session_mode_invalid(self, local_agent, session_id):
         """Test setting session mode with invalid mode ID."""
         with pytest.raises(RequestError):
-            await agent.set_session_mode(mode_id="invalid", session_id=str(uuid4()))
+            await local_agent.set_session_mode(mode_id="invalid", session_id=session_id)
 
     @pytest.mark.asyncio
-    async def test_set_session_mode_updates_confirmation_policy(self, agent):
+    async def test_set_session_mode_updates_confirmation_policy(
+        self, agent_setup, session_id
+    ):
         """Test that setting mode updates conversation's confirmation policy."""
-        from openhands.sdk.security.confirmation_policy import (
-            AlwaysConfirm,
-            NeverConfirm,
-        )
-
-        session_id = str(uuid4())
-        mock_conversation = MagicMock()
-        mock_conversation.state.confirmation_policy = AlwaysConfirm()
-        mock_conversation.state.events = []
+        agent, setup_session = agent_setup
+        state = SimpleNamespace(confirmation_policy=AlwaysConfirm(), events=[])
 
         def set_policy_side_effect(new_policy):
-            mock_conversation.state.confirmation_policy = new_policy
+            state.confirmation_policy = new_policy
 
-        mock_conversation.set_confirmation_policy = MagicMock(
-            side_effect=set_policy_side_effect
+        mock_conversation = SimpleNamespace(
+            state=state,
+            set_confirmation_policy=MagicMock(side_effect=set_policy_side_effect),
+            set_security_analyzer=MagicMock(),
         )
-        mock_conversation.set_security_analyzer = MagicMock()
-        agent._active_sessions[session_id] = mock_conversation
-
-        if isinstance(agent, OpenHandsCloudACPAgent):
-            agent._active_workspaces[session_id] = MagicMock()
+        setup_session(session_id, mock_conversation)
 
         await agent.set_session_mode(mode_id="always-approve", session_id=session_id)
 
@@ -173,14 +192,11 @@ class TestCancel:
     """Tests for cancel - ensures both agents handle cancellation consistently."""
 
     @pytest.mark.asyncio
-    async def test_cancel_pauses_conversation(self, agent):
+    async def test_cancel_pauses_conversation(self, agent_setup, session_id):
         """Test that cancel pauses the conversation."""
-        session_id = str(uuid4())
-        mock_conversation = MagicMock()
-        agent._active_sessions[session_id] = mock_conversation
-
-        if isinstance(agent, OpenHandsCloudACPAgent):
-            agent._active_workspaces[session_id] = MagicMock()
+        agent, setup_session = agent_setup
+        mock_conversation = SimpleNamespace(pause=MagicMock())
+        setup_session(session_id, mock_conversation)
 
         await agent.cancel(session_id=session_id)
 
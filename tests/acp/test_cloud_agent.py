@@ -4,77 +4,99 @@ Common behavior shared with LocalOpenHandsACPAgent is tested in test_agent_commo
 This file tests cloud-specific functionality: authentication, workspace management.
 """
 
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, call, patch
-from uuid import uuid4
 
 import pytest
-from acp import RequestError
+from acp import NewSessionResponse, RequestError
 from acp.schema import TextContentBlock
 
 from openhands_cli.acp_impl.agent import OpenHandsCloudACPAgent
+from openhands_cli.auth.device_flow import DeviceFlowError
+from tests.acp.conftest import resolved_future
 
 
-@pytest.fixture
+pytestmark = pytest.mark.cloud
+
+
+@pytest.fixture(scope="module")
 def mock_connection():
-    """Create a mock ACP connection."""
+    """Create a mock ACP connection shared across the module."""
     return AsyncMock()
 
 
-@pytest.fixture
-def cloud_agent(mock_connection):
-    """Create an OpenHands Cloud ACP agent instance."""
-    with patch(
-        "openhands_cli.acp_impl.agent.base_agent.TokenStorage"
-    ) as mock_storage_class:
-        mock_storage = MagicMock()
+@pytest.fixture(autouse=True)
+def _reset_mock_connection(mock_connection):
+    """Clear call history on the shared connection before each test."""
+    mock_connection.reset_mock()
+
+
+@pytest.fixture(autouse=True)
+def cloud_deps():
+    """Patch the cloud agent's token storage, token check and login command.
+
+    Tests adjust behaviour by setting ``return_value``/``side_effect`` on the
+    exposed mocks instead of opening their own ``patch`` blocks. The token check
+    reports a valid token by default; override its ``side_effect`` (not
+    ``return_value``) to change that.
+    """
+    with (
+        patch(
+            "openhands_cli.acp_impl.agent.base_agent.TokenStorage"
+        ) as mock_storage_class,
+        patch(
+            "openhands_cli.acp_impl.agent.remote_agent.is_token_valid",
+            new_callable=MagicMock,
+            side_effect=lambda *args, **kwargs: resolved_future(True),
+        ) as mock_is_token_valid,
+        patch(
+            "openhands_cli.auth.login_command.login_command",
+            new_callable=AsyncMock,
+        ) as mock_login,
+    ):
+        mock_storage = mock_storage_class.return_value
         mock_storage.get_api_key.return_value = "test-api-key"
-        mock_storage_class.return_value = mock_storage
-        return OpenHandsCloudACPAgent(
-            conn=mock_connection,
-            initial_confirmation_mode="always-ask",
-            cloud_api_url="https://app.all-hands.dev",
+        yield SimpleNamespace(
+            storage=mock_storage,
+            is_token_valid=mock_is_token_valid,
+            login_command=mock_login,
         )
 
 
+@pytest.fixture
+def cloud_agent(mock_connection, cloud_deps):
+    """Create an OpenHands Cloud ACP agent instance."""
+    return OpenHandsCloudACPAgent(
+        conn=mock_connection,
+        initial_confirmation_mode="always-ask",
+        cloud_api_url="https://app.all-hands.dev",
+    )
+
+
 class TestNewSessionAuthentication:
     """Tests for new_session authentication requirements."""
 
     @pytest.mark.asyncio
     async def test_new_session_raises_auth_required_when_not_authenticated(
-        self, mock_connection
+        self, mock_connection, cloud_deps
     ):
         """Test that new_session raises auth_required when user is not authenticated."""
-        with patch(
-            "openhands_cli.acp_impl.agent.base_agent.TokenStorage"
-        ) as mock_storage_class:
-            mock_storage = MagicMock()
-            mock_storage.get_api_key.return_value = None
-            mock_storage_class.return_value = mock_storage
-
-            agent = OpenHandsCloudACPAgent(
-                conn=mock_connection, initial_confirmation_mode="always-ask"
-            )
+        cloud_deps.storage.get_api_key.return_value = None
+        agent = OpenHandsCloudACPAgent(
+            conn=mock_connection, initial_confirmation_mode="always-ask"
+        )
 
-            with pytest.raises(RequestError) as exc_info:
-                await agent.new_session(cwd="/tmp", mcp_servers=[])
+        with pytest.raises(RequestError) as exc_info:
+            await agent.new_session(cwd="/tmp", mcp_servers=[])
 
-            assert "Authentication required" in str(exc_info.value.data)
+        assert "Authentication required" in str(exc_info.value.data)
 
     @pytest.mark.asyncio
     async def test_new_session_proceeds_when_authenticated(self, cloud_agent):
         """Test that new_session proceeds when user is authenticated."""
-        from acp import NewSessionResponse
-
-        with (
-            patch(
-                "openhands_cli.acp_impl.agent.remote_agent.is_token_valid",
-                new_callable=AsyncMock,
-                return_value=True,
-            ),
-            patch.object(
-                cloud_agent, "_get_or_create_conversation", new_callable=AsyncMock
-            ) as mock_get_conv,
-        ):
+        with patch.object(
+            cloud_agent, "_get_or_create_conversation", new_callable=AsyncMock
+        ) as mock_get_conv:
             mock_conversation = MagicMock()
             mock_conversation.state.events = []
             mock_get_conv.return_value = mock_conversation
@@ -101,34 +123,27 @@ class TestAuthenticate:
         )
 
     @pytest.mark.asyncio
-    async def test_authenticate_executes_login_command(self, cloud_agent):
+    async def test_authenticate_executes_login_command(self, cloud_agent, cloud_deps):
         """Test that authenticate executes the login_command for OAuth."""
-        with patch(
-            "openhands_cli.auth.login_command.login_command",
-            new_callable=AsyncMock,
-        ) as mock_login:
-            result = await cloud_agent.authenticate(method_id="oauth")
+        result = await cloud_agent.authenticate(method_id="oauth")
 
-            mock_login.assert_called_once_with(
-                "https://app.all-hands.dev", skip_settings_sync=True
-            )
-            assert result is not None
+        cloud_deps.login_command.assert_called_once_with(
+            "https://app.all-hands.dev", skip_settings_sync=True
+        )
+        assert result is not None
 
     @pytest.mark.asyncio
-    async def test_authenticate_handles_device_flow_error(self, cloud_agent):
+    async def test_authenticate_handles_device_flow_error(
+        self, cloud_agent, cloud_deps
+    ):
         """Test that authenticate handles DeviceFlowError properly."""
-        from openhands_cli.auth.device_flow import DeviceFlowError
+        cloud_deps.login_command.side_effect = DeviceFlowError("User denied access")
 
-        with patch(
-            "openhands_cli.auth.login_command.login_command",
-            new_callable=AsyncMock,
-            side_effect=DeviceFlowError("User denied access"),
-        ):
-            with pytest.raises(RequestError) as exc_info:
-                await cloud_agent.authenticate(method_id="oauth")
+        with pytest.raises(RequestError) as exc_info:
+            await cloud_agent.authenticate(method_id="oauth")
 
-            assert exc_info.value.data is not None
-            assert "Authentication failed" in exc_info.value.data.get("reason", "")
+        assert exc_info.value.data is not None
+        assert "Authentication failed" in exc_info.value.data.get("reason", "")
 
 
 class TestPrompt:
@@ -136,75 +151,63 @@ class TestPrompt:
 
     @pytest.mark.asyncio
     async def test_prompt_returns_end_turn_for_empty_prompt(
-        self, cloud_agent, mock_connection
+        self, cloud_agent, mock_connection, session_id
     ):
         """Test prompt returns end_turn for empty content."""
-        session_id = str(uuid4())
         mock_workspace = MagicMock()
         mock_workspace.alive = True
         cloud_agent._active_workspaces[session_id] = mock_workspace
 
-        with patch.object(
-            cloud_agent, "_get_or_create_conversation", new_callable=AsyncMock
-        ) as mock_get:
-            mock_conversation = MagicMock()
-            mock_get.return_value = mock_conversation
+        cloud_agent._get_or_create_conversation = AsyncMock(return_value=MagicMock())
 
-            response = await cloud_agent.prompt(prompt=[], session_id=session_id)
+        response = await cloud_agent.prompt(prompt=[], session_id=session_id)
 
-            assert response.stop_reason == "end_turn"
+        assert response.stop_reason == "end_turn"
 
     @pytest.mark.asyncio
     async def test_prompt_resumes_when_workspace_not_alive(
-        self, cloud_agent, mock_connection
+        self, cloud_agent, mock_connection, session_id
     ):
         """Test that prompt triggers resume when workspace is not alive."""
-        session_id = str(uuid4())
         mock_workspace = MagicMock()
         mock_workspace.alive = False
         cloud_agent._active_workspaces[session_id] = mock_workspace
 
-        with patch.object(
-            cloud_agent, "_get_or_create_conversation", new_callable=AsyncMock
-        ) as mock_get:
-            mock_conversation = MagicMock()
-            mock_get.return_value = mock_conversation
+        mock_get = AsyncMock(return_value=MagicMock())
+        cloud_agent._get_or_create_conversation = mock_get
 
-            await cloud_agent.prompt(prompt=[], session_id=session_id)
+        await cloud_agent.prompt(prompt=[], session_id=session_id)
 
-            # Verify _get_or_create_conversation was called with is_resuming=True
-            # (first call from override, second call from base class)
-            calls = mock_get.call_args_list
-            assert len(calls) >= 1
-            # First call should have is_resuming=True
-            assert calls[0] == call(session_id=session_id, is_resuming=True)
+        # Verify _get_or_create_conversation was called with is_resuming=True
+        # (first call from override, second call from base class)
+        calls = mock_get.call_args_list
+        assert len(calls) >= 1
+        # First call should have is_resuming=True
+        assert calls[0] == call(session_id=session_id, is_resuming=True)
 
     @pytest.mark.asyncio
     async def test_prompt_does_not_resume_when_workspace_alive(
-        self, cloud_agent, mock_connection
+        self, cloud_agent, mock_connection, session_id
     ):
         """Test that prompt does not trigger resume when workspace is alive."""
-        session_id = str(uuid4())
         mock_workspace = MagicMock()
         mock_workspace.alive = True
         cloud_agent._active_workspaces[session_id] = mock_workspace
 
-        with patch.object(
-            cloud_agent, "_get_or_create_conversation", new_callable=AsyncMock
-        ) as mock_get:
-            mock_conversation = MagicMock()
-            mock_get.return_value = mock_conversation
+        mock_get = AsyncMock(return_value=MagicMock())
+        cloud_agent._get_or_create_conversation = mock_get
 
-            await cloud_agent.prompt(prompt=[], session_id=session_id)
+        await cloud_agent.prompt(prompt=[], session_id=session_id)
 
-            # Verify _get_or_create_conversation was called (from base class)
-            # without is_resuming=True (workspace is alive, no resume needed)
-            mock_get.assert_called_once_with(session_id=session_id)
+        # Verify _get_or_create_conversation was called (from base class)
+        # without is_resuming=True (workspace is alive, no resume needed)
+        mock_get.assert_called_once_with(session_id=session_id)
 
     @pytest.mark.asyncio
-    async def test_prompt_handles_exception(self, cloud_agent, mock_connection):
+    async def test_prompt_handles_exception(
+        self, cloud_agent, mock_connection, session_id
+    ):
         """Test prompt handles exceptions and sends error message."""
-        session_id = str(uuid4())
         mock_workspace = MagicMock()
         mock_workspace.alive = True
         cloud_agent._active_workspaces[session_id] = mock_workspace
@@ -212,20 +215,19 @@ class TestPrompt:
         mock_conversation = MagicMock()
         mock_conversation.send_message.side_effect = Exception("Test error")
 
-        with patch.object(
-            cloud_agent, "_get_or_create_conversation", new_callable=AsyncMock
-        ) as mock_get:
-            mock_get.return_value = mock_conversation
+        cloud_agent._get_or_create_conversation = AsyncMock(
+            return_value=mock_conversation
+        )
 
-            with pytest.raises(RequestError) as exc_info:
-                await cloud_agent.prompt(
-                    prompt=[TextContentBlock(type="text", text="Hello")],
-                    session_id=session_id,
-                )
+        with pytest.raises(RequestError) as exc_info:
+            await cloud_agent.prompt(
+                prompt=[TextContentBlock(type="text", text="Hello")],
+                session_id=session_id,
+            )
 
-            assert exc_info.value.data is not None
-            assert "Failed to process prompt" in exc_info.value.data.get("reason", "")
-            mock_connection.session_update.assert_called()
+        assert exc_info.value.data is not None
+        assert "Failed to process prompt" in exc_info.value.data.get("reason", "")
+        mock_connection.session_update.assert_called()
 
 
 class TestLoadSession:
@@ -235,10 +237,21 @@ class TestLoadSession:
     """
 
     @pytest.mark.asyncio
-    async def test_load_session_not_found_returns_helpful_message(self, cloud_agent):
-        """Test load_session raises error with helpful message for cloud mode."""
-        session_id = str(uuid4())
+    async def test_load_session_rejects_invalid_uuid(self, cloud_agent):
+        """Test the cloud load_session override validates the session ID."""
+        with pytest.raises(RequestError) as exc_info:
+            await cloud_agent.load_session(
+                cwd="/tmp", mcp_servers=[], session_id="not-a-uuid"
+            )
 
+        assert exc_info.value.data is not None
+        assert "Invalid session ID" in exc_info.value.data.get("reason", "")
+
+    @pytest.mark.asyncio
+    async def test_load_session_not_found_returns_helpful_message(
+        self, cloud_agent, session_id
+    ):
+        """Test load_session raises error with helpful message for cloud mode."""
         with pytest.raises(RequestError) as exc_info:
             await cloud_agent.load_session(
                 cwd="/tmp", mcp_servers=[], session_id=session_id
@@ -253,11 +266,10 @@ class TestLoadSession:
 class TestCleanupSession:
     """Tests for the _cleanup_session method."""
 
-    def test_cleanup_removes_workspace_and_conversation(self, cloud_agent):
+    def test_cleanup_removes_workspace_and_conversation(self, cloud_agent, session_id):
         """Test _cleanup_session cleans up both workspace and conversation."""
-        session_id = str(uuid4())
-        mock_workspace = MagicMock()
-        mock_conversation = MagicMock()
+        mock_workspace = SimpleNamespace(cleanup=MagicMock())
+        mock_conversation = SimpleNamespace(close=MagicMock())
         cloud_agent._active_workspaces[session_id] = mock_workspace
         cloud_agent._active_sessions[session_id] = mock_conversation
 
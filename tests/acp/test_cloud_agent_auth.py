@@ -4,37 +4,54 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from openhands_cli.acp_impl.agent import OpenHandsCloudACPAgent
+from openhands_cli.acp_impl.agent import OpenHandsCloudACPAgent, remote_agent
+from tests.acp.conftest import resolved_future
 
 
-@pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "api_key,token_valid,expected",
-    [
-        pytest.param(None, False, False, id="no-api-key"),
-        pytest.param("valid-key", True, True, id="valid-key"),
-        pytest.param("expired-key", False, False, id="expired-key"),
-    ],
-)
-async def test_is_authenticated(api_key, token_valid, expected):
-    """Test _is_authenticated based on API key and token validity."""
-    mock_conn = AsyncMock()
+pytestmark = pytest.mark.cloud
+
+
+@pytest.fixture(scope="module")
+def token_storage():
+    """Patch TokenStorage for the whole module and expose its instance mock."""
     with patch(
         "openhands_cli.acp_impl.agent.base_agent.TokenStorage"
     ) as mock_storage_class:
-        mock_storage = MagicMock()
-        mock_storage.get_api_key.return_value = api_key
-        mock_storage_class.return_value = mock_storage
+        yield mock_storage_class.return_value
+
 
-        agent = OpenHandsCloudACPAgent(
-            conn=mock_conn,
+@pytest.fixture(scope="module")
+def cloud_agent_factory(token_storage):
+    """Return a callable building a cloud agent whose stored API key is given."""
+    conn = AsyncMock()
+
+    def factory(api_key: str | None) -> OpenHandsCloudACPAgent:
+        token_storage.get_api_key.return_value = api_key
+        return OpenHandsCloudACPAgent(
+            conn=conn,
             initial_confirmation_mode="always-ask",
         )
 
-        with patch(
-            "openhands_cli.acp_impl.agent.remote_agent.is_token_valid",
-            new_callable=AsyncMock,
-            return_value=token_valid,
-        ):
-            result = await agent._is_authenticated()
-            assert result is expected
+    return factory
+
+
+_IS_AUTHENTICATED_CASES = (
+    # (case id, stored api key, token valid, expected)
+    ("no-api-key", None, False, False),
+    ("valid-key", "valid-key", True, True),
+    ("expired-key", "expired-key", False, False),
+)
+
+
+@pytest.mark.asyncio
+async def test_is_authenticated(cloud_agent_factory, monkeypatch):
+    """Test _is_authenticated based on API key and token validity."""
+    mock_is_token_valid = MagicMock()
+    monkeypatch.setattr(remote_agent, "is_token_valid", mock_is_token_valid)
+
+    for case_id, api_key, token_valid, expected in _IS_AUTHENTICATED_CASES:
+        agent = cloud_agent_factory(api_key)
+        mock_is_token_valid.return_value = resolved_future(token_valid)
+
+        result = await agent._is_authenticated()
+        assert result is expected, case_id
@@ -310,6 +310,20 @@ def cleanup_work_dir() -> None:
 # =============================================================================
 
 
+@pytest.fixture(scope="session", autouse=True)
+def preload_app_modules() -> None:
+    """Import the TUI app and its SDK dependencies once per session.
+
+    Tests still import OpenHandsApp lazily after their fixtures run. Those
+    imports then hit sys.modules, so the first test's snapshot run no longer
+    includes the cost of loading Textual and the SDK. All location getters
+    read environment variables at call time, so importing early is safe.
+    """
+    import openhands.sdk.security.confirmation_policy  # noqa: F401
+    import openhands_cli.tui.panels.history_side_panel  # noqa: F401
+    import openhands_cli.tui.textual_app  # noqa: F401
+
+
 @pytest.fixture(autouse=True)
 def e2e_test_environment(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
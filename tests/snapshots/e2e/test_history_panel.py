@@ -9,7 +9,9 @@ Test flow:
 6. Wait for previous conversation to load (loaded conversation)
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, cast
+
+import pytest
 
 from .helpers import type_text, wait_for_app_ready, wait_for_idle
 
@@ -17,6 +19,8 @@ from .helpers import type_text, wait_for_app_ready, wait_for_idle
 if TYPE_CHECKING:
     from textual.pilot import Pilot
 
+    from openhands_cli.tui.textual_app import OpenHandsApp
+
 
 def _create_app(conversation_id):
     """Create an OpenHandsApp instance for testing."""
@@ -45,12 +49,23 @@ async def _open_history_panel(pilot: "Pilot") -> None:
     await pilot.press("enter")
     await pilot.press("enter")
     await wait_for_idle(pilot)
-    await pilot.wait_for_scheduled_animations()
+
+
+async def _toggle_history_panel(pilot: "Pilot") -> None:
+    """Open the history panel via the app action, skipping the /history typing.
+
+    Only phase 1 snapshots the slash-command path; later phases just need the
+    panel to be open.
+    """
+    await wait_for_app_ready(pilot)
+
+    cast("OpenHandsApp", pilot.app).action_toggle_history()
+    await wait_for_idle(pilot)
 
 
 async def _run_first_conversation(pilot: "Pilot") -> None:
     """Phase 2: Open history panel and run first conversation."""
-    await _open_history_panel(pilot)
+    await _toggle_history_panel(pilot)
 
     # Run first conversation
     await type_text(pilot, "echo hello world")
@@ -76,7 +91,6 @@ async def _start_new_conversation(pilot: "Pilot") -> None:
     await pilot.press("enter")
     await pilot.press("enter")
     await wait_for_idle(pilot)
-    await pilot.wait_for_scheduled_animations()
 
 
 async def _run_second_conversation(pilot: "Pilot") -> None:
@@ -98,7 +112,7 @@ async def _click_previous_conversation(pilot: "Pilot") -> None:
     # Click on the previous (older) conversation
     # The history panel shows conversations with the newest first,
     # so we want to click on the second item (index 1) which is the older one
-    history_items = list(pilot.app.query(HistoryItem))
+    history_items = pilot.app.query(HistoryItem)
     if len(history_items) >= 2:
         # Click on the second item (the older conversation)
         # Use on_click() method directly since pilot.click requires a selector
@@ -112,7 +126,6 @@ async def _wait_for_conversation_load(pilot: "Pilot") -> None:
 
     # Wait for conversation switch to complete
     await wait_for_idle(pilot)
-    await pilot.wait_for_scheduled_animations()
 
 
 # =============================================================================
@@ -120,6 +133,7 @@ async def _wait_for_conversation_load(pilot: "Pilot") -> None:
 # =============================================================================
 
 
+@pytest.mark.slow
 class TestHistoryPanelFlow:
     """Test history panel and conversation switching flow.
 
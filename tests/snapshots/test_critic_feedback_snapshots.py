@@ -90,36 +90,36 @@ class MockCriticFeedbackWidget(Static, can_focus=True):
             yield Button(self.BUTTON_LABELS["dismiss"], id="btn-dismiss", compact=True)
 
 
+class CriticFeedbackTestApp(App):
+    """Test app hosting the mock critic feedback widget."""
+
+    CSS = """
+    Screen {
+        background: $background;
+    }
+    #content {
+        width: 100%;
+        height: auto;
+        padding: 1;
+    }
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.register_theme(OPENHANDS_THEME)
+        self.theme = OPENHANDS_THEME.name
+
+    def compose(self) -> ComposeResult:
+        yield Static("Sample conversation content above the widget", id="content")
+        yield MockCriticFeedbackWidget()
+        yield Footer()
+
+
 class TestCriticFeedbackWidgetSnapshots:
     """Snapshot tests for the CriticFeedbackWidget."""
 
     def test_critic_feedback_widget_display(self, snap_compare):
         """Snapshot test for critic feedback widget with buttons."""
-
-        class CriticFeedbackTestApp(App):
-            CSS = """
-            Screen {
-                background: $background;
-            }
-            #content {
-                width: 100%;
-                height: auto;
-                padding: 1;
-            }
-            """
-
-            def __init__(self, **kwargs):
-                super().__init__(**kwargs)
-                self.register_theme(OPENHANDS_THEME)
-                self.theme = OPENHANDS_THEME.name
-
-            def compose(self) -> ComposeResult:
-                yield Static(
-                    "Sample conversation content above the widget", id="content"
-                )
-                yield MockCriticFeedbackWidget()
-                yield Footer()
-
         assert snap_compare(
             CriticFeedbackTestApp(),
             terminal_size=(100, 20),
@@ -57,6 +57,28 @@ class TestLLMEnvOverridesFromEnv:
             overrides = LLMEnvOverrides.from_env()
             assert overrides.api_key is None
 
+    def test_disabled_returns_shared_empty_overrides(self) -> None:
+        """Disabled overrides should be a shared no-op instance."""
+        overrides = LLMEnvOverrides.from_env(enabled=False)
+        assert overrides is LLMEnvOverrides.from_env(enabled=False)
+        assert overrides.has_overrides() is False
+
+    def test_reuses_overrides_for_unchanged_env(self) -> None:
+        """from_env should reuse the instance until the env values change."""
+        env_vars = {
+            ENV_LLM_API_KEY: "env-api-key",
+            ENV_LLM_BASE_URL: "",
+            ENV_LLM_MODEL: "env-model",
+        }
+        with patch.dict(os.environ, env_vars, clear=False):
+            first = LLMEnvOverrides.from_env(enabled=True)
+            assert LLMEnvOverrides.from_env(enabled=True) is first
+
+        with patch.dict(os.environ, {**env_vars, ENV_LLM_MODEL: "other-model"}):
+            changed = LLMEnvOverrides.from_env(enabled=True)
+            assert changed is not first
+            assert changed.model == "other-model"
+
 
 class TestCheckAndWarnEnvVars:
     """Tests for check_and_warn_env_vars function."""
@@ -84,6 +106,18 @@ class TestCheckAndWarnEnvVars:
             assert "LLM_MODEL" in captured.err
             assert "--override-with-envs" in captured.err
 
+    def test_warning_lists_env_vars_in_stable_order(self, capsys) -> None:
+        """Detected env vars should be listed in a fixed order."""
+        env_vars = {
+            ENV_LLM_MODEL: "test-model",
+            ENV_LLM_BASE_URL: "https://env.url/",
+            ENV_LLM_API_KEY: "test-key",
+        }
+        with patch.dict(os.environ, env_vars, clear=False):
+            check_and_warn_env_vars()
+            captured = capsys.readouterr()
+            assert "LLM_API_KEY, LLM_BASE_URL, LLM_MODEL" in captured.err
+
 
 class TestLLMEnvOverrides:
     """Tests for LLMEnvOverrides Pydantic model."""
@@ -1,6 +1,8 @@
 from unittest.mock import MagicMock, patch
 
 from openhands.sdk import LLM, Agent
+from openhands.sdk.context import Skill
+from openhands_cli.setup import load_agent_specs
 from openhands_cli.stores import AgentStore
 
 
@@ -27,3 +29,25 @@ def test_agent_context_includes_os_info() -> None:
 
         suffix = loaded_agent.agent_context.system_message_suffix or ""
         assert "User operating system: TestOS" in suffix
+
+
+def test_agent_context_skills_do_not_accumulate_across_loads() -> None:
+    mock_agent = Agent(
+        llm=LLM(model="test/model", api_key="test-key", usage_id="test-service"),
+    )
+    extra_skill = Skill(name="extra", content="Extra context")
+
+    with (
+        patch("openhands_cli.stores.agent_store.LocalFileStore") as mock_file_store,
+        patch("openhands_cli.stores.agent_store.list_enabled_servers", return_value=[]),
+    ):
+        mock_store_instance = MagicMock()
+        mock_file_store.return_value = mock_store_instance
+        mock_store_instance.read.return_value = mock_agent.model_dump_json()
+
+        loaded = [load_agent_specs(skills=[extra_skill]) for _ in range(3)]
+
+    for agent in loaded:
+        assert agent.agent_context is not None
+        names = [skill.name for skill in agent.agent_context.skills]
+        assert names.count("extra") == 1
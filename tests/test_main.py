@@ -7,7 +7,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from openhands_cli.argparsers.main_parser import create_main_parser
+from openhands_cli.argparsers.main_parser import (
+    _parse_common_args,
+    create_main_parser,
+    parse_main_args,
+)
 from openhands_cli.entrypoint import main
 
 
@@ -31,6 +35,45 @@ def test_main_parser_accepts_task_and_file_flags():
     assert args.file == "README.md"
 
 
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["--yolo"],
+        ["--always-approve", "--override-with-envs"],
+        ["--llm-approve", "--exit-without-confirmation"],
+        ["--resume"],
+        ["--resume", "conversation-id"],
+        ["--resume", "--last"],
+        ["--last", "--resume"],
+    ],
+)
+def test_parse_main_args_fast_path_matches_argparse(argv):
+    fast = _parse_common_args(argv)
+    assert fast is not None
+    assert vars(fast) == vars(create_main_parser().parse_args(argv))
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["acp"],
+        ["--task", "do something"],
+        ["--headless", "--task", "x"],
+        ["--always-approve", "--llm-approve"],
+        ["--over"],
+        ["--resume", "-x"],
+    ],
+)
+def test_parse_main_args_falls_back_to_argparse(argv):
+    assert _parse_common_args(argv) is None
+
+
+def test_parse_main_args_reports_errors_via_argparse():
+    with pytest.raises(SystemExit):
+        parse_main_args(["--always-approve", "--llm-approve"])
+
+
 class TestMainEntryPoint:
     """Test the main entry point behavior."""
 
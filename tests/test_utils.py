@@ -24,6 +24,13 @@ def test_get_default_cli_tools_returns_expected_tools():
     assert tool_names == {"terminal", "file_editor", "task_tracker", "delegate"}
 
 
+def test_get_default_cli_tools_returns_fresh_list():
+    """Callers can mutate the returned list without affecting later calls."""
+    tools = get_default_cli_tools()
+    tools.clear()
+    assert len(get_default_cli_tools()) == 4
+
+
 def test_should_set_litellm_extra_body_for_openhands():
     """Test that litellm_extra_body is set for openhands models."""
     assert should_set_litellm_extra_body("openhands/claude-sonnet-4-5-20250929")
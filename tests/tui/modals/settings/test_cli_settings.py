@@ -51,6 +51,14 @@ class TestCliSettings:
             cfg = CliSettings.load()
         assert cfg == CliSettings()
 
+    def test_load_returns_defaults_when_persistence_dir_is_a_file(self, tmp_path: Path):
+        persistence_dir = tmp_path / "not_a_dir"
+        persistence_dir.write_text("")
+
+        with patch.dict(os.environ, {"PERSISTENCE_DIR": str(persistence_dir)}):
+            cfg = CliSettings.load()
+        assert cfg == CliSettings()
+
     @pytest.mark.parametrize(
         "file_content, expected",
         [
@@ -88,6 +96,20 @@ class TestCliSettings:
                 with pytest.raises(PermissionError):
                     CliSettings.load()
 
+    def test_load_reuses_parsed_settings_until_file_changes(self, tmp_path: Path):
+        config_path = tmp_path / "cli_config.json"
+        config_path.write_text(json.dumps({"enable_critic": False}))
+
+        with patch.object(CliSettings, "get_config_path", return_value=config_path):
+            first = CliSettings.load()
+            with patch("builtins.open", side_effect=AssertionError("re-read")):
+                second = CliSettings.load()
+            assert second == first
+            assert second is not first
+
+            CliSettings(enable_critic=True).save()
+            assert CliSettings.load().enable_critic is True
+
     @pytest.mark.parametrize("value", [True, False])
     def test_save_creates_parent_dir_and_roundtrips(self, tmp_path: Path, value: bool):
         config_path = tmp_path / "nested" / "dir" / "cli_config.json"
@@ -0,0 +1,83 @@
+"""Tests for critic visualization helpers."""
+
+import pytest
+
+from openhands.sdk.critic.result import CriticResult
+from openhands_cli.tui.utils.critic.visualization import (
+    _EMPTY_TEXT,
+    _build_critic_content,
+    _get_star_rating,
+    _get_star_style,
+)
+
+
+@pytest.mark.parametrize(
+    "score,expected",
+    [
+        (0.0, "☆☆☆☆☆"),
+        (0.2, "★☆☆☆☆"),
+        (0.61, "★★★☆☆"),
+        (1.0, "★★★★★"),
+        (-0.5, "☆☆☆☆☆"),
+        (1.5, "★★★★★"),
+    ],
+)
+def test_get_star_rating(score: float, expected: str):
+    assert _get_star_rating(score) == expected
+
+
+@pytest.mark.parametrize(
+    "score,expected",
+    [(0.0, "red"), (0.39, "red"), (0.4, "yellow"), (0.6, "green"), (1.0, "green")],
+)
+def test_get_star_style(score: float, expected: str):
+    assert _get_star_style(score) == expected
+
+
+def test_build_critic_content_from_categorized_features():
+    result = CriticResult(
+        score=0.5,
+        message="raw message",
+        metadata={
+            "categorized_features": {
+                "agent_behavioral_issues": [
+                    {"display_name": "Loops", "probability": 0.8},
+                    {"display_name": "Gives up", "probability": 0.3},
+                ],
+                "infrastructure_issues": [
+                    {"display_name": "Timeout", "probability": 0.55},
+                ],
+                "likely_follow_up": [
+                    {"display_name": "Hidden", "probability": 0.9},
+                ],
+            }
+        },
+    )
+
+    content = _build_critic_content(result)
+
+    assert content.plain == (
+        "Potential Issues: Loops (likelihood 80%) · Gives up (likelihood 30%)\n"
+        "Infrastructure: Timeout (likelihood 55%)"
+    )
+
+
+def test_build_critic_content_falls_back_to_message():
+    result = CriticResult(score=0.5, message="raw message")
+    assert _build_critic_content(result).plain == "\nraw message\n"
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        CriticResult(score=0.5, message=""),
+        CriticResult(score=0.5, message="  \n"),
+        CriticResult(
+            score=0.5,
+            message="ignored when categorized",
+            metadata={"categorized_features": {"likely_follow_up": [{"name": "x"}]}},
+        ),
+    ],
+)
+def test_build_critic_content_returns_shared_empty_text(result: CriticResult):
+    assert _build_critic_content(result) is _EMPTY_TEXT
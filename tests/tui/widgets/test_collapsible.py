@@ -1,6 +1,9 @@
+from typing import NamedTuple
+
 import pytest
+import pytest_asyncio
 from textual.app import App, ComposeResult
-from textual.widgets import Static
+from textual.pilot import Pilot
 
 from openhands_cli.theme import OPENHANDS_THEME
 from openhands_cli.tui.widgets.collapsible import (
@@ -10,23 +13,35 @@ from openhands_cli.tui.widgets.collapsible import (
 )
 
 
-class CollapsibleTestApp(App):
-    """Minimal Textual App that mounts a single Collapsible."""
+class _ThemedApp(App):
+    """Test App base that can activate the OpenHands theme.
 
-    def __init__(self, collapsible: Collapsible) -> None:
+    Structural tests leave ``apply_theme`` off and run on Textual's default
+    theme, which defines every variable the Collapsible CSS uses. Textual
+    stores registered themes per App instance, so each themed instance has to
+    register the theme itself before selecting it.
+    """
+
+    def __init__(self, apply_theme: bool = False) -> None:
         super().__init__()
+        if apply_theme:
+            self.register_theme(OPENHANDS_THEME)
+            self.theme = OPENHANDS_THEME.name
+
+
+class CollapsibleTestApp(_ThemedApp):
+    """Minimal Textual App that mounts a single Collapsible."""
+
+    def __init__(self, collapsible: Collapsible, apply_theme: bool = False) -> None:
+        super().__init__(apply_theme=apply_theme)
         self.collapsible = collapsible
-        self.register_theme(OPENHANDS_THEME)
-        self.theme = "openhands"
 
     def compose(self) -> ComposeResult:
         yield self.collapsible
 
 
-@pytest.mark.asyncio
-async def test_collapsible_initial_render() -> None:
-    """Collapsible in collapsed state
-    renders collapsed symbol + label in title."""
+def test_collapsible_initial_state() -> None:
+    """Collapsed Collapsible sets up its title without needing a running app."""
 
     collapsible = Collapsible(
         "some content",
@@ -36,26 +51,20 @@ async def test_collapsible_initial_render() -> None:
         expanded_symbol="▼",
     )
 
-    app = CollapsibleTestApp(collapsible)
-
-    async with app.run_test() as _pilot:
-        title_widget = collapsible.query_one(CollapsibleTitle)
-        title_static = title_widget.query_one(Static)
-
-        # Renderable is usually a Rich object; stringify for a robust check
-        rendered = str(title_static.content)
-        assert "▶" in rendered
-        assert "My Section" in rendered
+    title = collapsible._title
+    assert title.collapsed is True
+    assert title.collapsed_symbol == "▶"
+    assert str(title.label) == "My Section"
+    assert collapsible.has_class("-collapsed")
 
 
-@pytest.mark.asyncio
 async def test_toggle_updates_title_and_css_class() -> None:
     """Toggling collapsed updates the '-collapsed'
     CSS class and title.collapsed state."""
 
     collapsible = Collapsible("some content", title="Title", collapsed=True)
 
-    app = CollapsibleTestApp(collapsible)
+    app = CollapsibleTestApp(collapsible, apply_theme=True)
 
     async with app.run_test() as _pilot:
         # Initially collapsed
@@ -63,10 +72,12 @@ async def test_toggle_updates_title_and_css_class() -> None:
         assert collapsible.has_class("-collapsed")
         assert collapsible._title.collapsed is True
         assert collapsible._title._title_static is not None
+        rendered = str(collapsible._title._title_static.content)
+        assert "▶" in rendered
+        assert "Title" in rendered
 
         # Toggle to expanded
         collapsible.collapsed = False
-        await _pilot.pause()  # give Textual a tick if needed
 
         assert collapsible.collapsed is False
         assert not collapsible.has_class("-collapsed")
@@ -75,18 +86,13 @@ async def test_toggle_updates_title_and_css_class() -> None:
         assert "▼" in str(title_static.content)
 
 
-class MultiCollapsibleTestApp(CollapsibleNavigationMixin, App):
+class MultiCollapsibleTestApp(CollapsibleNavigationMixin, _ThemedApp):
     """App with multiple collapsibles for testing navigation.
 
     Uses CollapsibleNavigationMixin to share the same navigation logic
     as the main OpenHandsApp, ensuring tests verify the real behavior.
     """
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.register_theme(OPENHANDS_THEME)
-        self.theme = "openhands"
-
     def compose(self) -> ComposeResult:
         from textual.containers import VerticalScroll
 
@@ -96,95 +102,77 @@ class MultiCollapsibleTestApp(CollapsibleNavigationMixin, App):
             yield Collapsible("Content 3", title="Cell 3", collapsed=True)
 
 
-@pytest.mark.asyncio
-async def test_arrow_key_navigation_down() -> None:
-    """Down arrow navigates to the next cell."""
-    app = MultiCollapsibleTestApp()
+class MultiPilot(NamedTuple):
+    """Running MultiCollapsibleTestApp plus its cells, looked up once."""
 
-    async with app.run_test() as pilot:
-        # Get all collapsibles
-        collapsibles = list(app.query(Collapsible))
-        assert len(collapsibles) == 3
+    app: MultiCollapsibleTestApp
+    pilot: Pilot
+    collapsibles: list[Collapsible]
+    titles: list[CollapsibleTitle]
 
-        # Focus the first cell's title
-        first_title = collapsibles[0].query_one(CollapsibleTitle)
-        first_title.focus()
-        await pilot.pause()
-        assert app.focused == first_title
 
-        # Press down arrow - should focus second cell
-        await pilot.press("down")
-        second_title = collapsibles[1].query_one(CollapsibleTitle)
-        assert app.focused == second_title
-
-
-@pytest.mark.asyncio
-async def test_arrow_key_navigation_up() -> None:
-    """Up arrow navigates to the previous cell."""
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def multi_pilot():
+    """Run a single MultiCollapsibleTestApp shared by the navigation tests."""
     app = MultiCollapsibleTestApp()
-
-    async with app.run_test() as pilot:
-        # Get all collapsibles
-        collapsibles = list(app.query(Collapsible))
-
-        # Focus the second cell's title
-        second_title = collapsibles[1].query_one(CollapsibleTitle)
-        second_title.focus()
-        await pilot.pause()
-        assert app.focused == second_title
-
-        # Press up arrow - should focus first cell
-        await pilot.press("up")
-        first_title = collapsibles[0].query_one(CollapsibleTitle)
-        assert app.focused == first_title
-
-
-@pytest.mark.asyncio
-async def test_arrow_navigation_at_boundaries() -> None:
-    """Arrow keys at boundaries don't crash or change focus."""
-    app = MultiCollapsibleTestApp()
-
     async with app.run_test() as pilot:
         collapsibles = list(app.query(Collapsible))
+        titles = [c.query_one(CollapsibleTitle) for c in collapsibles]
+        yield MultiPilot(app, pilot, collapsibles, titles)
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def multi_app(multi_pilot):
+    """Reset the shared app to all cells collapsed and nothing focused."""
+    for collapsible in multi_pilot.collapsibles:
+        collapsible.collapsed = True
+    multi_pilot.app.set_focus(None)
+    await multi_pilot.pilot.pause()
+    return multi_pilot
+
+
+@pytest.mark.asyncio(loop_scope="module")
+@pytest.mark.parametrize(
+    "start,key,expected",
+    [
+        pytest.param(0, "down", 1, id="down"),
+        pytest.param(1, "up", 0, id="up"),
+        pytest.param(0, "up", 0, id="up_at_first"),
+        pytest.param(2, "down", 2, id="down_at_last"),
+    ],
+)
+async def test_arrow_key_navigation(multi_app, start, key, expected) -> None:
+    """Arrow keys move focus between cells and stop at the boundaries."""
+    app, pilot, collapsibles, titles = multi_app
+    assert len(collapsibles) == 3
 
-        # Focus the first cell and press up - should stay on first
-        first_title = collapsibles[0].query_one(CollapsibleTitle)
-        first_title.focus()
-        await pilot.pause()
-        await pilot.press("up")
-        assert app.focused == first_title
+    titles[start].focus()
+    await pilot.pause()
+    assert app.focused == titles[start]
 
-        # Focus the last cell and press down - should stay on last
-        last_title = collapsibles[2].query_one(CollapsibleTitle)
-        last_title.focus()
-        await pilot.pause()
-        await pilot.press("down")
-        assert app.focused == last_title
+    await pilot.press(key)
+    assert app.focused == titles[expected]
 
 
-@pytest.mark.asyncio
-async def test_enter_still_toggles_collapsible() -> None:
+@pytest.mark.asyncio(loop_scope="module")
+async def test_enter_still_toggles_collapsible(multi_app) -> None:
     """Enter key still toggles the collapsible state."""
-    app = MultiCollapsibleTestApp()
+    _, pilot, collapsibles, titles = multi_app
+    first_collapsible = collapsibles[0]
 
-    async with app.run_test() as pilot:
-        collapsibles = list(app.query(Collapsible))
-        first_collapsible = collapsibles[0]
+    # Focus the first cell's title
+    titles[0].focus()
+    await pilot.pause()
 
-        # Focus the first cell's title
-        first_title = first_collapsible.query_one(CollapsibleTitle)
-        first_title.focus()
-        await pilot.pause()
-
-        # Initially collapsed
-        assert first_collapsible.collapsed is True
+    # Initially collapsed
+    assert first_collapsible.collapsed is True
 
-        # Press enter - should toggle to expanded
-        await pilot.press("enter")
-        await pilot.pause()
-        assert first_collapsible.collapsed is False
+    # Press enter - should toggle to expanded
+    await pilot.press("enter")
+    await pilot.pause()
+    assert first_collapsible.collapsed is False
 
-        # Press enter again - should toggle back to collapsed
-        await pilot.press("enter")
-        await pilot.pause()
-        assert first_collapsible.collapsed is True
+    # Press enter again - should toggle back to collapsed
+    await pilot.press("enter")
+    await pilot.pause()
+    assert first_collapsible.collapsed is True